@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Static imports for PyInstaller
+
+Imported by invisiovault.py so that PyInstaller's import graph walk picks up
+these modules directly instead of needing --hidden-import arguments.
+"""
+
+import PyQt5.QtCore  # noqa: F401
+import PyQt5.QtGui  # noqa: F401
+import PyQt5.QtWidgets  # noqa: F401
+
+try:
+    import sip  # noqa: F401
+except ImportError:
+    # PyQt5 >= 5.11 ships sip as a private submodule
+    from PyQt5 import sip  # noqa: F401
@@ -2,7 +2,7 @@
 echo Building InvisioVault executable...
 echo.
 
-python build.py
+python build.py %*
 
 echo.
 echo If the build was successful, you can find the executable in the dist folder.
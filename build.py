@@ -1,124 +1,395 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Build script for InvisioVault
-
-This script builds the InvisioVault application into a standalone executable
-using PyInstaller.
-"""
-
-import os
-import sys
-import shutil
-import subprocess
-
-# Configuration
-APP_NAME = "InvisioVault"
-MAIN_SCRIPT = "invisiovault.py"
-OUTPUT_DIR = "dist"
-ICON_FILE = "InvisioVault.ico"  # Application icon file
-
-
-def clean_build_dirs():
-    """Clean build directories"""
-    dirs_to_clean = ["build", "dist", f"{APP_NAME}.spec"]
-    for dir_path in dirs_to_clean:
-        if os.path.exists(dir_path):
-            if os.path.isdir(dir_path):
-                shutil.rmtree(dir_path)
-            else:
-                os.remove(dir_path)
-    print("Cleaned build directories.")
-
-
-def install_dependencies():
-    """Install required dependencies"""
-    print("Installing dependencies...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-    print("Dependencies installed.")
-
-
-def build_executable():
-    """Build the executable using PyInstaller"""
-    print(f"Building {APP_NAME} executable...")
-    
-    # Base PyInstaller command
-    cmd = [
-        "pyinstaller",
-        "--name", APP_NAME,
-        "--onefile",
-        "--windowed",
-        "--clean",
-    ]
-    
-    # Add icon if available
-    if ICON_FILE and os.path.exists(ICON_FILE):
-        cmd.extend(["--icon", ICON_FILE])
-    
-    # Add main script
-    cmd.append(MAIN_SCRIPT)
-    
-    # Run PyInstaller
-    # Use absolute paths and handle Python executable
-    invisivault_path = os.path.abspath('invisiovault.py')
-    version_file = os.path.abspath('version_info.txt')
-    cmd = [
-        sys.executable,
-        '-m',
-        'PyInstaller',
-        '--onefile',
-        '--noconsole',
-        '--name', 'InvisioVault',
-        '--icon', 'InvisioVault.ico',
-        '--version-file', version_file,
-        invisivault_path
-    ]
-    
-    try:
-        subprocess.check_call(
-        [
-            sys.executable,
-            '-m',
-            'PyInstaller',
-            '--onefile',
-            '--noconsole',
-            '--name', 'InvisioVault',
-            '--icon', os.path.abspath('InvisioVault.ico'),
-            '--version-file', os.path.abspath('version_info.txt'),
-            '--add-data', f'{os.path.abspath("history.json")};.',
-            '--hidden-import', 'PyQt5.QtCore',
-            '--hidden-import', 'PyQt5.QtGui',
-            '--hidden-import', 'PyQt5.QtWidgets',
-            '--hidden-import', 'sip',
-            '--paths', os.path.join(os.path.dirname(sys.executable), 'Lib', 'site-packages'),
-            '--paths', os.path.expanduser('~/.local/lib/python3.12/site-packages'),
-            os.path.abspath('invisiovault.py')
-        ],
-        shell=False
-    )
-    except subprocess.CalledProcessError as e:
-        print(f"Build failed with error code {e.returncode}")
-        sys.exit(1)
-    print(f"Build completed. Executable is in the '{OUTPUT_DIR}' directory.")
-
-
-def main():
-    """Main build function"""
-    print(f"=== Building {APP_NAME} ===\n")
-    
-    # Clean previous builds
-    clean_build_dirs()
-    
-    # Install dependencies
-    install_dependencies()
-    
-    # Build executable
-    build_executable()
-    
-    print(f"\n=== {APP_NAME} build completed successfully ===\n")
-    print(f"The executable is located at: {os.path.join(OUTPUT_DIR, APP_NAME)}.exe")
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build script for InvisioVault
+
+This script builds the InvisioVault application into a standalone executable
+using PyInstaller.
+"""
+
+import os
+import re
+import sys
+import ast
+import shutil
+import hashlib
+import argparse
+import tempfile
+import importlib.metadata
+import sysconfig
+import compileall
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Configuration
+APP_NAME = "InvisioVault"
+MAIN_SCRIPT = "invisiovault.py"
+OUTPUT_DIR = "dist"
+ICON_FILE = "InvisioVault.ico"  # Application icon file
+REQUIREMENTS_FILE = "requirements.txt"
+LOCK_FILE = "requirements.lock"  # Generated from REQUIREMENTS_FILE by _rollup_requirements
+CONSTRAINTS_FILE = "constraints-build.txt"  # Pins applied to every pip call
+WHEEL_CACHE = "wheelcache"  # Local wheel cache used by install_dependencies
+PIP_BINARY_ARGS = ["--prefer-binary", "--only-binary=:all:"]  # Never build sdists
+REQ_HASH_FILE = os.path.join("build", ".req.hash")  # Removed by clean_build_dirs
+SPEC_FILE = f"{APP_NAME}.spec"  # Generated by the first build, reused afterwards
+SPEC_HASH_FILE = os.path.join("build", ".spec.hash")
+# Warm PyInstaller cache shared across builds; never touched by clean_build_dirs
+PYI_CONFIG_DIR = os.path.expanduser("~/.cache/pyinstaller-invisiovault")
+
+# Build inputs, resolved once
+HERE = os.path.dirname(os.path.abspath(__file__))
+MAIN_SCRIPT_PATH = os.path.join(HERE, MAIN_SCRIPT)
+APP_SOURCES = [MAIN_SCRIPT_PATH, os.path.join(HERE, "_pyi_imports.py")]
+ICON_PATH = os.path.join(HERE, ICON_FILE)
+VERSION_FILE = os.path.join(HERE, "version_info.txt")
+QRC_FILE = os.path.join(HERE, "resources.qrc")
+RESOURCES_MODULE = os.path.join(HERE, "resources_rc.py")
+SITE_PACKAGES = os.path.join(os.path.dirname(sys.executable), 'Lib', 'site-packages')
+USER_SITE = os.path.expanduser('~/.local/lib/python3.12/site-packages')
+
+# Distribution names for imports that differ from their package name
+IMPORT_TO_DIST = {
+    'PIL': 'pillow',
+    'Crypto': 'pycryptodome',
+}
+# Requirements needed by the build itself rather than imported by the app
+BUILD_REQUIREMENTS = {'pyinstaller'}
+
+# Modules the application never imports; excluding them shrinks the Analysis graph.
+# unittest is kept because numpy.testing depends on it.
+EXCLUDES = [
+    'tkinter', 'pydoc', 'xmlrpc', 'test', 'distutils', 'setuptools', 'pip',
+    'onnxruntime', 'numpy.f2py',
+    'PyQt5.QtBluetooth', 'PyQt5.QtWebEngineWidgets',
+    'PyQt5.Qt3DCore', 'PyQt5.Qt3DRender', 'PyQt5.Qt3DInput', 'PyQt5.Qt3DLogic',
+    'PyQt5.Qt3DAnimation', 'PyQt5.Qt3DExtras',
+]
+
+# PyInstaller arguments shared by every CLI build
+PYI_ARGS = [
+    '--noconsole',
+    '--name', APP_NAME,
+    '--icon', ICON_PATH,
+    '--version-file', VERSION_FILE,
+    '--paths', SITE_PACKAGES,
+    '--paths', USER_SITE,
+]
+for module in EXCLUDES:
+    PYI_ARGS.extend(['--exclude-module', module])
+
+
+def _fast_rmtree(path):
+    """Remove a directory tree using os.scandir and direct unlink calls"""
+    stack = [path]
+    dirs = []
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+    # Directories are empty now; remove the deepest ones first
+    for dir_path in reversed(dirs):
+        os.rmdir(dir_path)
+
+
+def _remove_one(path):
+    """Remove a file or directory tree, ignoring paths that do not exist"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except (IsADirectoryError, PermissionError):
+        # Directories raise here (PermissionError on Windows)
+        if os.path.isdir(path):
+            _fast_rmtree(path)
+        else:
+            raise
+
+
+def clean_build_dirs():
+    """Clean build directories"""
+    dirs_to_clean = ["build", "dist", f"{APP_NAME}.spec"]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_remove_one, dirs_to_clean))
+    print("Cleaned build directories.")
+
+
+def _rollup_requirements():
+    """Write LOCK_FILE with only the requirements the application imports
+
+    The top-level imports of the application sources are collected with ast
+    and intersected with the pinned entries in REQUIREMENTS_FILE.
+    """
+    imported = set()
+    for source in APP_SOURCES:
+        with open(source, "rb") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                top = name.split('.')[0]
+                imported.add(IMPORT_TO_DIST.get(top, top).lower())
+    wanted = imported | BUILD_REQUIREMENTS
+    
+    lines = []
+    with open(REQUIREMENTS_FILE, "r") as f:
+        for line in f:
+            requirement = line.split('#', 1)[0].strip()
+            if not requirement:
+                continue
+            name = re.split(r'[<>=!~;\[\s]', requirement, 1)[0].lower()
+            if name in wanted:
+                lines.append(requirement)
+    
+    with open(LOCK_FILE, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _req_fingerprint():
+    """Fingerprint the requirement files together with the interpreter and environment"""
+    h = hashlib.sha256()
+    for path in (LOCK_FILE, CONSTRAINTS_FILE):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    # A new virtual environment with the same Python version starts out empty
+    h.update("\0".join([sys.version, sys.executable, sys.prefix]).encode())
+    return h.hexdigest()
+
+
+def _spec_fingerprint(release):
+    """Fingerprint the inputs that the generated spec file depends on"""
+    h = hashlib.sha256(_req_fingerprint().encode())
+    h.update(str(os.path.getmtime(MAIN_SCRIPT_PATH)).encode())
+    h.update(b"release" if release else b"dev")
+    # The spec embeds the PyInstaller options and absolute paths into the checkout
+    h.update("\0".join([HERE, MAIN_SCRIPT_PATH] + PYI_ARGS).encode())
+    return h.hexdigest()
+
+
+def _read_hash(hash_path):
+    """Return the fingerprint stored at hash_path, or None if unavailable"""
+    try:
+        with open(hash_path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_hash(hash_path, fingerprint):
+    """Atomically record a fingerprint at hash_path"""
+    os.makedirs(os.path.dirname(hash_path), exist_ok=True)
+    tmp_path = hash_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(fingerprint)
+    os.replace(tmp_path, hash_path)
+
+
+def install_dependencies(clean_future=None):
+    """Install required dependencies
+
+    Only the requirements the application actually imports are installed, from
+    the generated LOCK_FILE. Wheels are fetched in one batched download and
+    installed offline without bytecode compilation; the bytecode is then
+    generated in parallel.
+    
+    clean_future is a pending clean_build_dirs call running concurrently. The
+    clean invalidates the cached fingerprint, so it is ignored, and the new one
+    is only written once the clean has finished.
+    """
+    _rollup_requirements()
+    fingerprint = _req_fingerprint()
+    if clean_future is None and _read_hash(REQ_HASH_FILE) == fingerprint:
+        print("Dependencies unchanged, skipping installation.")
+        return
+    
+    print("Installing dependencies...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "download", *PIP_BINARY_ARGS,
+                               "-r", LOCK_FILE, "-c", CONSTRAINTS_FILE, "-d", WHEEL_CACHE])
+    except subprocess.CalledProcessError:
+        # Fall back to a plain install if the wheels could not be downloaded
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *PIP_BINARY_ARGS,
+                               "-r", LOCK_FILE, "-c", CONSTRAINTS_FILE])
+    else:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *PIP_BINARY_ARGS,
+                               "--no-index", "--find-links", WHEEL_CACHE, "-r", LOCK_FILE,
+                               "-c", CONSTRAINTS_FILE, "--no-compile"])
+        
+        # Compile bytecode using one worker process per core
+        compileall.compile_dir(sysconfig.get_paths()["purelib"], quiet=1, workers=0)
+    
+    if sys.platform == "win32":
+        # Make sure PyInstaller uses the fast pefile release
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *PIP_BINARY_ARGS,
+                               "-c", CONSTRAINTS_FILE, "pefile"])
+        print(f"Using pefile {importlib.metadata.version('pefile')}")
+    
+    if clean_future is not None:
+        clean_future.result()
+    _write_hash(REQ_HASH_FILE, fingerprint)
+    print("Dependencies installed.")
+
+
+def compile_resources():
+    """Compile resources.qrc into the resources_rc module imported by the app
+
+    The module is regenerated only when it is older than the .qrc file or
+    any of the files it lists.
+    """
+    with open(QRC_FILE, "r") as f:
+        sources = [os.path.join(HERE, name) for name in re.findall(r'<file>(.*?)</file>', f.read())]
+    if os.path.exists(RESOURCES_MODULE):
+        built = os.path.getmtime(RESOURCES_MODULE)
+        if all(os.path.getmtime(path) <= built for path in [QRC_FILE] + sources):
+            print("Resources unchanged, skipping compilation.")
+            return
+    print("Compiling Qt resources...")
+    subprocess.check_call([sys.executable, "-m", "PyQt5.pyrcc_main", QRC_FILE, "-o", RESOURCES_MODULE])
+
+
+def _work_dir():
+    """Return the PyInstaller scratch directory, preferring a RAM-backed tmpfs"""
+    work_dir = os.environ.get('PYI_WORK')
+    if not work_dir:
+        if sys.platform == 'linux' and os.path.isdir('/dev/shm'):
+            work_dir = os.path.join('/dev/shm', 'invisiovault_build')
+        else:
+            work_dir = os.path.join(tempfile.gettempdir(), 'invisiovault_build')
+    os.makedirs(work_dir, exist_ok=True)
+    return work_dir
+
+
+def build_executable(release=False):
+    """Build the executable using PyInstaller
+
+    Development builds use --onedir and --noarchive to skip the single-file
+    archive assembly and the PYZ compression; release builds produce a
+    --onefile executable and are post-packed with zstd.
+    """
+    print(f"Building {APP_NAME} executable...")
+    bundle_mode = '--onefile' if release else '--onedir'
+    
+    # Keep PyInstaller's scratch files in RAM where possible
+    work_dir = _work_dir()
+    work_dist = os.path.join(work_dir, 'dist')
+    env = os.environ.copy()
+    env['PYINSTALLER_CONFIG_DIR'] = PYI_CONFIG_DIR
+    os.makedirs(PYI_CONFIG_DIR, exist_ok=True)
+    
+    fingerprint = _spec_fingerprint(release)
+    if os.path.exists(SPEC_FILE) and _read_hash(SPEC_HASH_FILE) == fingerprint:
+        # Inputs unchanged: rebuild from the existing spec file
+        argv = [
+            sys.executable, '-m', 'PyInstaller',
+            '--noconfirm',
+            '--workpath', work_dir,
+            '--distpath', work_dist,
+            SPEC_FILE
+        ]
+    else:
+        argv = [
+            sys.executable, '-m', 'PyInstaller',
+            bundle_mode,
+            '--workpath', work_dir,
+            '--distpath', work_dist,
+            '--noconfirm',
+        ] + (['--noupx'] if release else ['--noarchive']) + PYI_ARGS + [MAIN_SCRIPT_PATH]
+    
+    # Echo PyInstaller's output line by line; undecodable bytes must not stop the
+    # reader, or PyInstaller would block on a full pipe
+    process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               bufsize=1, text=True, errors='replace', env=env)
+    with process.stdout:
+        for line in process.stdout:
+            print(line, end='', flush=True)
+    returncode = process.wait()
+    if returncode != 0:
+        print(f"Build failed with error code {returncode}")
+        sys.exit(1)
+    _write_hash(SPEC_HASH_FILE, fingerprint)
+    
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Copy only the final artifact back to the project disk
+    if release:
+        exe_name = APP_NAME + ('.exe' if sys.platform == 'win32' else '')
+        # Without .exe the executable shares its path with a dev build's onedir bundle
+        exe_path = os.path.join(OUTPUT_DIR, exe_name)
+        _remove_one(exe_path)
+        shutil.copy2(os.path.join(work_dist, exe_name), exe_path)
+    else:
+        # Drop the previous onedir bundle only now that the new one exists,
+        # so no stale files survive the copy and a failed build keeps the old one
+        _remove_one(os.path.join(OUTPUT_DIR, APP_NAME))
+        shutil.copytree(os.path.join(work_dist, APP_NAME), os.path.join(OUTPUT_DIR, APP_NAME))
+    print(f"Build completed. Executable is in the '{OUTPUT_DIR}' directory.")
+    
+    if release:
+        pack_release(exe_name)
+
+
+def pack_release(exe_name):
+    """Compress the release executable with multi-threaded zstd, if available
+
+    Only exe_name is archived, so other build output in OUTPUT_DIR is left out.
+    """
+    if not (shutil.which("zstd") and shutil.which("tar")):
+        print("zstd not found, skipping release archive.")
+        return
+    archive = f"{APP_NAME}.tar.zst"
+    subprocess.check_call(["tar", "--use-compress-program=zstd -T0 -19", "-cf", archive,
+                           "-C", OUTPUT_DIR, exe_name])
+    print(f"Release archive written to '{archive}'.")
+
+
+def main():
+    """Main build function"""
+    parser = argparse.ArgumentParser(description=f"Build {APP_NAME}")
+    parser.add_argument("--release", action="store_true",
+                        help="build a single-file release executable")
+    parser.add_argument("--clean", action="store_true",
+                        help="remove previous build output and cached spec first")
+    args = parser.parse_args()
+    
+    # Requirement files, caches, the spec file and dist are all relative
+    # paths; resolve them against the checkout, not the caller's directory
+    os.chdir(HERE)
+    
+    print(f"=== Building {APP_NAME} ===\n")
+    
+    # Clean previous builds only on request so the cached spec survives
+    if args.clean:
+        # Overlap the clean with the dependency installation
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            clean_future = executor.submit(clean_build_dirs)
+            install_future = executor.submit(install_dependencies, clean_future)
+            clean_future.result()
+            install_future.result()
+    else:
+        install_dependencies()
+    
+    # Bundle the icon and style sheet into the executable as Qt resources
+    compile_resources()
+    
+    # Build executable
+    build_executable(release=args.release)
+    
+    print(f"\n=== {APP_NAME} build completed successfully ===\n")
+    if args.release:
+        print(f"The executable is located at: {os.path.join(OUTPUT_DIR, APP_NAME)}.exe")
+    else:
+        print(f"The executable is located at: {os.path.join(OUTPUT_DIR, APP_NAME, APP_NAME)}.exe")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,7 +4,7 @@ echo.
 
 :: First, build the executable using PyInstaller
 echo Step 1: Building executable with PyInstaller...
-call build.bat
+call build.bat --release
 
 :: Check if the executable was built successfully
 if not exist "dist\InvisioVault.exe" (
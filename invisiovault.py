@@ -8,70 +8,220 @@ InvisioVault - A steganography application for hiding files within images
 import os
 import sys
 import json
+import mmap
+import queue
 import base64
+import struct
 import hashlib
+import functools
+import multiprocessing
 import datetime
 import binascii
 from io import BytesIO
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, List, Dict, Optional, Union
 
 import numpy as np
 from PIL import Image
 from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
+from Crypto.Util.Padding import unpad
 from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QFileDialog, QLineEdit,
                              QProgressBar, QMessageBox, QCheckBox, QListWidget, QGroupBox,
-                             QRadioButton, QButtonGroup, QTableWidget, QTableWidgetItem,
+                             QRadioButton, QButtonGroup, QTableView,
                              QHeaderView, QSplitter, QFrame, QTextEdit, QComboBox, QStackedWidget)
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPalette
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QFileInfo
+
+import _pyi_imports  # noqa: F401
+
+# Optional: compiled Qt resources, generated from resources.qrc by build.py.
+# Only frozen builds use them; running from source reads the files directly,
+# so edits to style.qss are not hidden behind a stale resources_rc.py.
+resources_rc = None
+if getattr(sys, 'frozen', False):
+    try:
+        import resources_rc  # noqa: F401
+    except ImportError:
+        pass
+
+# Optional: faster metadata and history (de)serialization; both helpers work on bytes
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        # Compact like orjson; nobody reads these by hand
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    def _json_loads(data):
+        return json.loads(data.decode())
 
 # Constants
 APP_NAME = "InvisioVault"
 APP_VERSION = "1.0.0"
 MAX_PASSWORD_ATTEMPTS = 3
-ENCRYPTION_HEADER = b"INVISIOVAULT"
+ENCRYPTION_HEADER = b"INVISIOVAULT"  # Legacy format: PBKDF2 key, AES-CBC
+ENCRYPTION_HEADER_V2 = b"IVAULTv2"  # Followed by one KDF byte and one cipher byte
+ENCRYPTION_HEADERS = (ENCRYPTION_HEADER, ENCRYPTION_HEADER_V2)
 AES_MODE = AES.MODE_CBC
 
+# Key derivation functions
+KDF_PBKDF2 = 0
+KDF_SCRYPT = 1
+DEFAULT_KDF = KDF_SCRYPT if hasattr(hashlib, 'scrypt') else KDF_PBKDF2
+
+# Ciphers
+CIPHER_CBC = 0  # AES-CBC with PKCS#7 padding, no authentication
+CIPHER_GCM = 1  # AES-GCM, 12-byte nonce and 16-byte tag
+GCM_NONCE_SIZE = 12
+GCM_TAG_SIZE = 16
+ENCRYPT_CHUNK_SIZE = 1024 * 1024  # Plaintext chunk size for streaming encryption
+LOSSY_EXTENSIONS = ('.jpg', '.jpeg', '.webp')  # Not usable as output images
+HISTORY_FILE = "history.jsonl"  # One JSON entry per line, appended to as operations finish
+LEGACY_HISTORY_FILE = "history.json"  # Single JSON list, read only when there is no HISTORY_FILE
+HISTORY_FIELDS = ("timestamp", "operation", "image", "files", "status")  # One history entry
+HISTORY_MAX_ENTRIES = 1000  # Newest history entries kept, in memory and on disk
+HISTORY_MAX_FILES = 50  # Extracted file paths stored per history entry
+HISTORY_SAVE_DELAY = 1000  # Milliseconds new history entries wait to be written together
+PREVIEW_CACHE_SIZE = 8  # Scaled image previews kept in memory
+STYLE_FILE = "style.qss"  # Application-wide style sheet, see resources.qrc
+NUMBA_MIN_BITS = 1 << 28  # Bits per channel plane from which the Numba kernel may repay its start-up
+
+
+@functools.lru_cache(maxsize=None)
+def _embed_kernel():
+    """Return the optional Numba embedding kernel, or None
+    
+    Numba is imported on first use rather than with the module, since every
+    worker process imports this module. Frozen builds skip it: the kernel
+    cache needs a writable source directory, and compiling it on every
+    operation costs more than it saves.
+    """
+    if getattr(sys, 'frozen', False):
+        return None
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def _embed_bits(flat, bits):
+        """Write bits into the least significant bit of the leading flat values"""
+        for i in prange(bits.size):
+            flat[i] = (flat[i] & 0xFE) | bits[i]
+    return _embed_bits
+
 
 class SteganographyEngine:
     """Core engine for steganography operations"""
     
     @staticmethod
-    def derive_key(password: str, salt: bytes = None) -> Tuple[bytes, bytes]:
+    def derive_key(password: str, salt: bytes = None, kdf: int = DEFAULT_KDF) -> Tuple[bytes, bytes]:
         """Derive encryption key from password"""
         if salt is None:
             salt = os.urandom(16)
-        key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000)
+        if kdf == KDF_SCRYPT:
+            # n=2**15, r=8 needs 32 MiB, which is exactly the default maxmem
+            key = hashlib.scrypt(password.encode(), salt=salt, n=2**15, r=8, p=1,
+                                 maxmem=64 * 1024 * 1024, dklen=32)
+        else:
+            key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000)
         return key, salt
     
     @staticmethod
-    def encrypt_data(data: bytes, password: str) -> bytes:
+    def encrypt_data(data: bytes, password: str) -> bytearray:
         """Encrypt data with password"""
-        salt = os.urandom(16)
-        key, _ = SteganographyEngine.derive_key(password, salt)
-        iv = os.urandom(16)
-        cipher = AES.new(key, AES_MODE, iv)
-        encrypted_data = cipher.encrypt(pad(data, AES.block_size))
-        # Format: HEADER + SALT + IV + ENCRYPTED_DATA
-        return ENCRYPTION_HEADER + salt + iv + encrypted_data
+        key, salt = SteganographyEngine.derive_key(password)
+        return SteganographyEngine.encrypt_with_key(data, key, salt, DEFAULT_KDF)
+    
+    @staticmethod
+    def encrypt_with_key(data: bytes, key: bytes, salt: bytes, kdf: int) -> bytearray:
+        """Encrypt data with a key derived from the password and salt by kdf"""
+        return SteganographyEngine.encrypt_buffers_with_key((data,), key, salt, kdf)
+    
+    @staticmethod
+    def encrypt_buffers(buffers, password: str) -> bytearray:
+        """Encrypt the concatenation of buffers with password"""
+        key, salt = SteganographyEngine.derive_key(password)
+        return SteganographyEngine.encrypt_buffers_with_key(buffers, key, salt, DEFAULT_KDF)
+    
+    @staticmethod
+    def encrypt_buffers_with_key(buffers, key: bytes, salt: bytes, kdf: int) -> bytearray:
+        """Encrypt the concatenation of buffers chunk by chunk
+        
+        One cipher context is kept for the whole stream and the ciphertext is
+        written into a single preallocated output buffer, so the plaintext is
+        never joined in memory.
+        """
+        nonce = os.urandom(GCM_NONCE_SIZE)
+        cipher = AES.new(key, AES.MODE_GCM, nonce=nonce, mac_len=GCM_TAG_SIZE)
+        
+        # Format: HEADER_V2 + KDF + CIPHER + SALT + NONCE + ENCRYPTED_DATA + TAG
+        prefix = ENCRYPTION_HEADER_V2 + bytes([kdf, CIPHER_GCM]) + salt + nonce
+        output = bytearray(len(prefix) + sum(len(b) for b in buffers) + GCM_TAG_SIZE)
+        output[:len(prefix)] = prefix
+        offset = len(prefix)
+        with memoryview(output) as out_view:
+            for buffer in buffers:
+                with memoryview(buffer) as view:
+                    for start in range(0, len(view), ENCRYPT_CHUNK_SIZE):
+                        with view[start:start + ENCRYPT_CHUNK_SIZE] as chunk:
+                            cipher.encrypt(chunk, output=out_view[offset:offset + len(chunk)])
+                            offset += len(chunk)
+            out_view[offset:] = cipher.digest()
+        return output
     
     @staticmethod
     def decrypt_data(encrypted_data: bytes, password: str) -> bytes:
         """Decrypt data with password"""
-        if not encrypted_data.startswith(ENCRYPTION_HEADER):
+        # Work with offsets so the ciphertext is never copied
+        if encrypted_data.startswith(ENCRYPTION_HEADER_V2):
+            offset = len(ENCRYPTION_HEADER_V2) + 2
+            kdf, cipher_id = encrypted_data[len(ENCRYPTION_HEADER_V2):offset]
+        elif encrypted_data.startswith(ENCRYPTION_HEADER):
+            offset = len(ENCRYPTION_HEADER)
+            kdf, cipher_id = KDF_PBKDF2, CIPHER_CBC
+        else:
             raise ValueError("Invalid data format")
         
-        # Extract components
-        data = encrypted_data[len(ENCRYPTION_HEADER):]
-        salt = data[:16]
-        iv = data[16:32]
-        actual_encrypted_data = data[32:]
+        if kdf not in (KDF_PBKDF2, KDF_SCRYPT) or cipher_id not in (CIPHER_CBC, CIPHER_GCM):
+            raise ValueError("Unsupported encryption format")
+        
+        # Derive key
+        salt = bytes(encrypted_data[offset:offset + 16])
+        key, _ = SteganographyEngine.derive_key(password, salt, kdf)
+        
+        if cipher_id == CIPHER_GCM:
+            start = offset + 16 + GCM_NONCE_SIZE
+            end = len(encrypted_data) - GCM_TAG_SIZE
+            if end < start:
+                raise ValueError("Invalid data format")
+            nonce = bytes(encrypted_data[offset + 16:start])
+            tag = bytes(encrypted_data[end:])
+            cipher = AES.new(key, AES.MODE_GCM, nonce=nonce, mac_len=GCM_TAG_SIZE)
+            
+            # Decrypt chunk by chunk into a preallocated buffer, then check the
+            # tag before any of the plaintext is handed back
+            output = bytearray(end - start)
+            with memoryview(encrypted_data) as view, memoryview(output) as out_view:
+                for chunk_start in range(0, len(output), ENCRYPT_CHUNK_SIZE):
+                    chunk_end = min(chunk_start + ENCRYPT_CHUNK_SIZE, len(output))
+                    cipher.decrypt(view[start + chunk_start:start + chunk_end],
+                                   output=out_view[chunk_start:chunk_end])
+            try:
+                cipher.verify(tag)
+            except ValueError:
+                raise ValueError("Incorrect password or corrupted data")
+            return output
         
-        # Derive key and decrypt
-        key, _ = SteganographyEngine.derive_key(password, salt)
+        # Legacy CBC data has no tag, so a padding error is the only sign of
+        # a wrong password or corruption
+        iv = encrypted_data[offset + 16:offset + 32]
+        actual_encrypted_data = encrypted_data[offset + 32:]
         cipher = AES.new(key, AES_MODE, iv)
         try:
             decrypted_data = unpad(cipher.decrypt(actual_encrypted_data), AES.block_size)
@@ -83,30 +233,36 @@ class SteganographyEngine:
     def prepare_file_data(file_path: str, password: Optional[str] = None) -> bytes:
         """Prepare file data for hiding"""
         with open(file_path, 'rb') as f:
-            file_data = f.read()
-        
-        # Create metadata
-        metadata = {
-            "filename": os.path.basename(file_path),
-            "size": len(file_data),
-            "timestamp": datetime.datetime.now().isoformat(),
-        }
-        
-        # Combine metadata and file data
-        metadata_bytes = json.dumps(metadata).encode()
-        metadata_length = len(metadata_bytes).to_bytes(4, byteorder='big')
-        combined_data = metadata_length + metadata_bytes + file_data
-        
-        # Encrypt if password provided
-        if password:
-            return SteganographyEngine.encrypt_data(combined_data, password)
-        return combined_data
+            file_size = os.fstat(f.fileno()).st_size
+            
+            # Create metadata
+            metadata = {
+                "filename": os.path.basename(file_path),
+                "size": file_size,
+                "timestamp": datetime.datetime.now().isoformat(),
+            }
+            metadata_bytes = _json_dumps(metadata)
+            header = len(metadata_bytes).to_bytes(4, byteorder='big') + metadata_bytes
+            
+            # Encrypt if password provided, streaming the mapped file through the cipher
+            if password:
+                if file_size == 0:
+                    return SteganographyEngine.encrypt_buffers((header,), password)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return SteganographyEngine.encrypt_buffers((header, mapped), password)
+            
+            # Read the file straight into place after the metadata
+            combined_data = bytearray(len(header) + file_size)
+            combined_data[:len(header)] = header
+            with memoryview(combined_data) as view:
+                f.readinto(view[len(header):])
+            return combined_data
     
     @staticmethod
     def extract_file_data(data: bytes, password: Optional[str] = None) -> Tuple[Dict, bytes]:
         """Extract file metadata and content from data"""
         # Decrypt if needed
-        if data.startswith(ENCRYPTION_HEADER):
+        if data.startswith(ENCRYPTION_HEADERS):
             if not password:
                 raise ValueError("This data is encrypted. Password is required.")
             try:
@@ -120,7 +276,7 @@ class SteganographyEngine:
         file_data = data[4+metadata_length:]
         
         try:
-            metadata = json.loads(metadata_bytes.decode())
+            metadata = _json_loads(metadata_bytes)
             return metadata, file_data
         except json.JSONDecodeError:
             raise ValueError("Invalid metadata format")
@@ -141,49 +297,46 @@ class SteganographyEngine:
     def hide_data_in_image(image_path: str, output_path: str, data: bytes) -> bool:
         """Hide data in image using LSB steganography"""
         try:
+            # Lossy formats would destroy the hidden bits
+            if os.path.splitext(output_path)[1].lower() in LOSSY_EXTENSIONS:
+                raise ValueError("Output image must be saved in a lossless format (PNG or BMP)")
+            
             # Open the image
             img = Image.open(image_path)
             if img.mode != 'RGB':
                 img = img.convert('RGB')
             
-            # Convert image to numpy array for faster processing
-            pixels = np.array(img)
-            
             # Prepare data with size prefix
             data_size = len(data).to_bytes(4, byteorder='big')
             full_data = data_size + data
             
-            # Check if image is large enough
-            if not SteganographyEngine.can_hide_data(image_path, len(full_data)):
+            # Check if image is large enough (one bit per RGB channel value)
+            if (img.width * img.height * 3) // 8 < len(full_data):
                 return False
             
-            # Convert data to bit array
-            bits = []
-            for byte in full_data:
-                for i in range(8):
-                    bits.append((byte >> i) & 1)
+            # Convert data to bit array (least significant bit of each byte first)
+            bits = np.unpackbits(np.frombuffer(full_data, dtype=np.uint8), bitorder='little')
             
-            # Pad bits array to ensure we have enough bits
-            while len(bits) % 3 != 0:
-                bits.append(0)
+            # Split into contiguous R, G and B planes; copy because they are modified
+            planes = [np.frombuffer(band.tobytes(), dtype=np.uint8).copy() for band in img.split()]
             
-            # Hide data in image
-            idx = 0
-            for i in range(pixels.shape[0]):
-                for j in range(pixels.shape[1]):
-                    if idx < len(bits):
-                        # Modify the least significant bit of each color channel
-                        for k in range(min(3, len(bits) - idx)):
-                            # Ensure we're working with valid uint8 values
-                            pixels[i, j, k] = (pixels[i, j, k] & 254) | bits[idx + k]
-                        idx += 3
-                    else:
-                        break
-                if idx >= len(bits):
-                    break
+            # Hide data in image: the bits go into the least significant bit of
+            # consecutive RGB channel values in row-major order, so channel c
+            # takes every third bit starting at bit c
+            # The NumPy path is as fast for all but very large payloads
+            embed_bits = _embed_kernel() if bits.size // 3 >= NUMBA_MIN_BITS else None
+            for channel, plane in enumerate(planes):
+                channel_bits = np.ascontiguousarray(bits[channel::3])
+                if embed_bits is not None:
+                    embed_bits(plane, channel_bits)
+                else:
+                    plane[:channel_bits.size] &= np.uint8(0xFE)
+                    plane[:channel_bits.size] |= channel_bits
             
-            # Save the modified image
-            Image.fromarray(pixels).save(output_path)
+            # Save the modified image; the LSB noise barely compresses, so use
+            # the fastest PNG compression level
+            bands = [Image.frombuffer('L', img.size, plane, 'raw', 'L', 0, 1) for plane in planes]
+            Image.merge('RGB', bands).save(output_path, optimize=False, compress_level=1)
             return True
         except Exception as e:
             print(f"Error hiding data: {str(e)}")
@@ -195,74 +348,53 @@ class SteganographyEngine:
         try:
             # Open the image
             img = Image.open(image_path)
-            if img.mode != 'RGB':
+            if img.mode not in ('RGB', 'RGBA'):
                 img = img.convert('RGB')
             
-            # Convert image to numpy array for faster processing
-            pixels = np.array(img)
-            
-            # Extract bits from image
-            extracted_bits = []
-            for i in range(pixels.shape[0]):
-                for j in range(pixels.shape[1]):
-                    for k in range(3):  # RGB channels
-                        # Extract the least significant bit
-                        extracted_bits.append(int(pixels[i, j, k] & 1))
-                    if len(extracted_bits) >= 32:  # We have enough bits for the size
-                        break
-                if len(extracted_bits) >= 32:
-                    break
-            
-            # Convert first 32 bits to size value
-            size_bits = extracted_bits[:32]
-            size_bytes = bytearray()
-            for i in range(0, 32, 8):
-                byte = 0
-                for j in range(8):
-                    if i + j < len(size_bits):
-                        byte |= (size_bits[i + j] << j)
-                size_bytes.append(byte)
-            
-            data_size = int.from_bytes(size_bytes, byteorder='big')
-            total_bits_needed = 32 + (data_size * 8)  # Size bits + data bits
+            if img.mode == 'RGB':
+                # Read-only view of the raw RGB bytes, no extra copy
+                flat = np.frombuffer(img.tobytes(), dtype=np.uint8)
+            else:
+                # Drop the alpha channel without a full convert
+                flat = np.asarray(img)[..., :3].reshape(-1)
             
-            # Extract remaining bits if needed
-            while len(extracted_bits) < total_bits_needed:
-                i = (len(extracted_bits) // 3) // pixels.shape[1]
-                j = (len(extracted_bits) // 3) % pixels.shape[1]
-                if i >= pixels.shape[0]:
-                    break
-                for k in range(3):  # RGB channels
-                    if len(extracted_bits) < total_bits_needed:
-                        # Extract the least significant bit consistently
-                        extracted_bits.append(int(pixels[i, j, k] & 1))
+            # The first 32 bits hold the size of the hidden data
+            size_bytes = np.packbits(flat[:32] & np.uint8(1), bitorder='little')
+            data_size = int.from_bytes(size_bytes.tobytes(), byteorder='big')
             
-            # Convert data bits to bytes
-            data_bits = extracted_bits[32:total_bits_needed]
-            data_bytes = bytearray()
-            for i in range(0, len(data_bits), 8):
-                if i + 8 <= len(data_bits):
-                    byte = 0
-                    for j in range(8):
-                        byte |= (data_bits[i + j] << j)
-                    data_bytes.append(byte)
+            # A size beyond the image capacity means there is no hidden data
+            if data_size > (flat.size - 32) // 8:
+                return b''
             
-            return bytes(data_bytes)
+            # Only read the channel values that carry the payload
+            end_bit = 32 + data_size * 8
+            data_bytes = np.packbits(flat[32:end_bit] & np.uint8(1), bitorder='little')
+            return data_bytes.tobytes()
         except Exception as e:
             print(f"Error extracting data: {str(e)}")
             return b''
 
 
-class WorkerThread(QThread):
-    """Worker thread for background processing"""
-    progress_signal = pyqtSignal(int)
-    status_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal(bool, str)
+class _QueueSignal:
+    """Signal stand-in that forwards emitted values through a process queue"""
     
-    def __init__(self, task_type, params):
-        super().__init__()
+    def __init__(self, queue, name):
+        self.queue = queue
+        self.name = name
+    
+    def emit(self, *args):
+        self.queue.put((self.name,) + args)
+
+
+class WorkerTask:
+    """Hide/extract task executed inside a worker process"""
+    
+    def __init__(self, task_type, params, queue):
         self.task_type = task_type
         self.params = params
+        self.progress_signal = _QueueSignal(queue, "progress")
+        self.status_signal = _QueueSignal(queue, "status")
+        self.finished_signal = _QueueSignal(queue, "finished")
     
     def run(self):
         try:
@@ -281,27 +413,40 @@ class WorkerThread(QThread):
         password = self.params.get("password")
         
         try:
-            # Prepare all files data
+            # Derive the key once for the whole run
+            if password:
+                self.status_signal.emit("Deriving encryption key...")
+                key, salt = SteganographyEngine.derive_key(password)
+            
+            # Prepare all files data, reading the files concurrently
             all_files_data = []
             total_size = 0
             
-            for i, file_path in enumerate(files):
-                self.status_signal.emit(f"Preparing file {i+1}/{len(files)}: {os.path.basename(file_path)}")
-                file_data = SteganographyEngine.prepare_file_data(file_path, None)  # Don't encrypt individual files
-                all_files_data.append(file_data)
-                total_size += len(file_data)
-                self.progress_signal.emit(int((i+1) / len(files) * 50))  # First 50% for preparation
+            self.status_signal.emit(f"Preparing {len(files)} files...")
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                # Don't encrypt individual files
+                prepared = executor.map(lambda path: SteganographyEngine.prepare_file_data(path, None), files)
+                for i, (file_path, file_data) in enumerate(zip(files, prepared)):
+                    self.status_signal.emit(f"Prepared file {i+1}/{len(files)}: {os.path.basename(file_path)}")
+                    all_files_data.append(file_data)
+                    total_size += len(file_data)
+                    self.progress_signal.emit(int((i+1) / len(files) * 50))  # First 50% for preparation
             
-            # Combine all files data
-            combined_data = len(all_files_data).to_bytes(4, byteorder='big')
-            for data in all_files_data:
-                size = len(data).to_bytes(4, byteorder='big')
-                combined_data += size + data
+            # Pack the file count and all sizes at once, then interleave the
+            # sizes with the file data in a single join
+            num_files = len(all_files_data)
+            sizes = struct.pack(f'>{num_files + 1}I', num_files, *map(len, all_files_data))
+            chunks = [sizes[:4]]
+            for i, data in enumerate(all_files_data, 1):
+                chunks += (sizes[4 * i:4 * i + 4], data)
             
-            # Encrypt the combined data if password provided
+            # Encrypt the combined data if password provided, streaming the
+            # chunks through the cipher instead of joining them first
             if password:
                 self.status_signal.emit("Encrypting data...")
-                combined_data = SteganographyEngine.encrypt_data(combined_data, password)
+                combined_data = SteganographyEngine.encrypt_buffers_with_key(chunks, key, salt, DEFAULT_KDF)
+            else:
+                combined_data = b''.join(chunks)
             
             # Check if image can hold the data
             if not SteganographyEngine.can_hide_data(image_path, len(combined_data)):
@@ -337,7 +482,7 @@ class WorkerThread(QThread):
             self.progress_signal.emit(30)
             
             # Decrypt data if needed
-            if data.startswith(ENCRYPTION_HEADER):
+            if data.startswith(ENCRYPTION_HEADERS):
                 if not password:
                     raise ValueError("This image contains encrypted data. Please provide a password.")
                 self.status_signal.emit("Decrypting data...")
@@ -399,6 +544,75 @@ class WorkerThread(QThread):
             self.finished_signal.emit(False, str(e))
 
 
+def _run_worker_task(task_type, params, queue):
+    """Entry point of the worker process started by WorkerThread"""
+    WorkerTask(task_type, params, queue).run()
+
+
+class WorkerThread(QThread):
+    """Worker thread for background processing
+    
+    The CPU-heavy work runs in a separate process so it is not limited by the
+    GIL; this thread relays the process's progress to the Qt signals.
+    """
+    progress_signal = pyqtSignal(int)
+    status_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, str)
+    invalid_path_signal = pyqtSignal(str)  # Emitted instead of finished_signal when an input is missing
+    
+    def __init__(self, task_type, params, parent=None):
+        super().__init__(parent)
+        self.task_type = task_type
+        self.params = params
+    
+    def _check_paths(self):
+        """Return an error message if an input path does not exist, else None"""
+        if not os.path.isfile(self.params["image_path"]):
+            if self.task_type == "hide":
+                return "Please select a valid carrier image."
+            return "Please select a valid image."
+        if self.task_type == "hide":
+            for file_path in self.params["files"]:
+                if not os.path.isfile(file_path):
+                    return f"File not found: {file_path}"
+        elif not os.path.isdir(self.params["output_dir"]):
+            return "Please specify a valid output directory."
+        return None
+    
+    def run(self):
+        # Checked here rather than in the GUI thread, which slow network shares would stall
+        error = self._check_paths()
+        if error:
+            self.invalid_path_signal.emit(error)
+            return
+        
+        context = multiprocessing.get_context('spawn')
+        message_queue = context.Queue()
+        process = context.Process(target=_run_worker_task,
+                                  args=(self.task_type, self.params, message_queue),
+                                  daemon=True)
+        process.start()
+        
+        signals = {
+            "progress": self.progress_signal,
+            "status": self.status_signal,
+            "finished": self.finished_signal,
+        }
+        while True:
+            try:
+                name, *args = message_queue.get(timeout=0.1)
+            except queue.Empty:
+                if not process.is_alive() and message_queue.empty():
+                    self.status_signal.emit("Error: worker process exited unexpectedly")
+                    self.finished_signal.emit(False, "Worker process exited unexpectedly")
+                    break
+                continue
+            signals[name].emit(*args)
+            if name == "finished":
+                break
+        process.join()
+
+
 class SplashScreen(QWidget):
     """Splash screen showing application branding"""
     
@@ -760,21 +974,7 @@ class AppController(QMainWindow):
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
         self.setMinimumSize(900, 700)
         
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "InvisioVault.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #08081a, stop:1 #1a1a3a);
-                border: 1px solid #0cebf0;
-            }
-        """)
-        
-        self.background_timer = QTimer(self)
-        self.background_timer.timeout.connect(self.update_background)
-        self.background_timer.start(50)
-        self.background_offset = 0
+        self.setWindowIcon(QIcon(resource_path("InvisioVault.ico")))
         
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
@@ -789,62 +989,127 @@ class AppController(QMainWindow):
         
         self.stacked_widget.setCurrentWidget(self.splash_screen)
         
+        # Each transition reuses one fade-out animation owned by the outgoing screen
+        self._create_fade_out(self.splash_screen, self.disclaimer_screen)
+        self._create_fade_out(self.disclaimer_screen, self.main_app)
+        
         QTimer.singleShot(2500, self.show_disclaimer)
     
-    def update_background(self):
-        self.background_offset += 1
-        if self.background_offset > 100:
-            self.background_offset = 0
-    
     def show_disclaimer(self):
-        self.fade_out = QtCore.QPropertyAnimation(self.splash_screen.fade_effect, b"opacity")
-        self.fade_out.setDuration(500)
-        self.fade_out.setStartValue(1.0)
-        self.fade_out.setEndValue(0.0)
-        self.fade_out.start()
-        
-        self.disclaimer_screen.setVisible(False)
-        if hasattr(self.disclaimer_screen, 'fade_effect'):
-            self.disclaimer_screen.fade_effect.setOpacity(0.0)
-        
-        self.fade_out.finished.connect(lambda: self._switch_to_screen(self.disclaimer_screen))
+        self.splash_screen.fade_out.start()
     
     def show_main_app(self):
-        self.fade_out = QtCore.QPropertyAnimation(self.disclaimer_screen.fade_effect, b"opacity")
-        self.fade_out.setDuration(500)
-        self.fade_out.setStartValue(1.0)
-        self.fade_out.setEndValue(0.0)
-        self.fade_out.start()
-        
-        self.main_app.setVisible(False)
-        if hasattr(self.main_app, 'fade_effect'):
-            self.main_app.fade_effect.setOpacity(0.0)
-        
-        self.fade_out.finished.connect(lambda: self._switch_to_screen(self.main_app))
+        self.disclaimer_screen.fade_out.start()
+    
+    def _create_fade_out(self, screen, next_screen):
+        """Create the animation that fades out screen, then switches to next_screen"""
+        screen.fade_out = QtCore.QPropertyAnimation(screen.fade_effect, b"opacity", screen)
+        screen.fade_out.setDuration(500)
+        screen.fade_out.setStartValue(1.0)
+        screen.fade_out.setEndValue(0.0)
+        screen.fade_out.setEasingCurve(QtCore.QEasingCurve.InOutQuad)
+        screen.fade_out.finished.connect(lambda: self._switch_to_screen(next_screen))
     
     def _switch_to_screen(self, screen):
         if screen == self.disclaimer_screen:
             self.disclaimer_screen.controller = self
         
-        if hasattr(screen, 'fade_effect'):
-            screen.fade_effect.setOpacity(0.0)
-        
         self.stacked_widget.setCurrentWidget(screen)
-        screen.setVisible(True)
-        
-        if hasattr(screen, 'fade_effect'):
-            fade_in = QtCore.QPropertyAnimation(screen.fade_effect, b"opacity")
-            fade_in.setDuration(0)
-            fade_in.setStartValue(0.0)
-            fade_in.setEndValue(1.0)
-            fade_in.start()
-            fade_in.finished.connect(lambda: self._ensure_screen_visible(screen))
-    
-    def _ensure_screen_visible(self, screen):
         if hasattr(screen, 'fade_effect'):
             screen.fade_effect.setOpacity(1.0)
-        screen.setVisible(True)
         screen.setFocus()
+    
+    def closeEvent(self, event):
+        # Write history entries still waiting for the save timer
+        self.main_app.flush_history()
+        super().closeEvent(event)
+
+
+@functools.lru_cache(maxsize=1024)
+def _basename(path):
+    """os.path.basename, cached since history entries often repeat paths"""
+    return os.path.basename(path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _files_summary(files):
+    """Join the basenames of a tuple of paths, truncated for the history table"""
+    # Stop collecting names once the joined text is past the cut-off
+    names = []
+    length = -2
+    for f in files:
+        name = _basename(f)
+        names.append(name)
+        length += len(name) + 2
+        if length > 50:
+            break
+    files_str = ", ".join(names)
+    if len(files_str) > 50:
+        files_str = files_str[:47] + "..."
+    return files_str
+
+
+class HistoryModel(QtCore.QAbstractTableModel):
+    """Table model over the operation history, held as one list per field in HISTORY_FIELDS"""
+    
+    HEADERS = ["Date", "Operation", "Image", "Files", "Status"]
+    
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self._display = [None] * len(columns[0])  # Formatted cell strings per row, filled on first paint
+    
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns[0])
+    
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        # Cells are formatted only when the view asks for them, once per row
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        display = self._display[row]
+        if display is None:
+            display = self._display[row] = self._format_row(row)
+        return display[index.column()]
+    
+    def _format_row(self, row):
+        timestamp, operation, image, files, status = (column[row] for column in self.columns)
+        try:
+            timestamp = datetime.datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        except Exception:
+            pass
+        return (timestamp, operation, _basename(image), _files_summary(tuple(files)), status)
+    
+    def append(self, values):
+        # Once the history is full the oldest entry makes room
+        if len(self.columns[0]) >= HISTORY_MAX_ENTRIES:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, 0)
+            for column in self.columns:
+                del column[0]
+            del self._display[0]
+            self.endRemoveRows()
+        
+        row = len(self.columns[0])
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        self._display.append(None)
+        self.endInsertRows()
+    
+    def clear(self):
+        self.beginResetModel()
+        for column in self.columns:
+            column.clear()
+        self._display.clear()
+        self.endResetModel()
 
 
 class MainWindow(QMainWindow):
@@ -852,14 +1117,26 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
-        self.setMinimumSize(900, 700)
+        # Title and minimum size come from AppController, which hosts this window
+        self.setup_style()
         
-        # Remove opacity effect completely
-        self.setAttribute(Qt.WA_AlwaysStackOnTop)
-        self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint | Qt.WA_ShowWithoutActivating)
+        # Window background gradient, rendered once per size in resizeEvent
+        self._background = QPixmap()
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
         
-        self.setup_style()
+        # Scaled previews keyed by (path, mtime, width, height), least recently used first
+        self._preview_cache = OrderedDict()
+        
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self._history_path = os.path.join(base_dir, HISTORY_FILE)
+        self._legacy_history_path = os.path.join(base_dir, LEGACY_HISTORY_FILE)
+        
+        # History entries not yet written; flushed together once operations settle
+        self._pending_history = []
+        self._history_save_timer = QTimer(self)
+        self._history_save_timer.setSingleShot(True)
+        self._history_save_timer.setInterval(HISTORY_SAVE_DELAY)
+        self._history_save_timer.timeout.connect(self.flush_history)
         
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -878,211 +1155,50 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.history_tab, "History")
         self.tabs.addTab(self.about_tab, "About")
         
-        self.setup_hide_tab()
-        self.setup_extract_tab()
-        self.setup_history_tab()
-        self.setup_about_tab()
-        
-        self.history = self.load_history()
-        self.update_history_table()
+        # Tab contents are built the first time each tab is shown
+        self._tab_setups = {
+            self.hide_tab: self.setup_hide_tab,
+            self.extract_tab: self.setup_extract_tab,
+            self.history_tab: self.setup_history_tab,
+            self.about_tab: self.setup_about_tab,
+        }
+        self.tabs.currentChanged.connect(self._build_tab)
+        self._build_tab(self.tabs.currentIndex())
         
         self.statusBar().showMessage("Ready")
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        dpr = self.devicePixelRatioF()
+        self._background = QPixmap(self.size() * dpr)
+        self._background.setDevicePixelRatio(dpr)
+        gradient = QtGui.QLinearGradient(0, 0, self.width(), self.height())
+        gradient.setColorAt(0.0, QColor("#08081a"))
+        gradient.setColorAt(0.5, QColor("#0c0c25"))
+        gradient.setColorAt(1.0, QColor("#15153a"))
+        painter = QtGui.QPainter(self._background)
+        painter.fillRect(self.rect(), gradient)
+        painter.end()
+    
+    def paintEvent(self, event):
+        if self._background.isNull():
+            return
+        # Blit only the exposed part; the source rect is in device pixels
+        target = QtCore.QRectF(event.rect())
+        dpr = self._background.devicePixelRatio()
+        source = QtCore.QRectF(target.topLeft() * dpr, target.size() * dpr)
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(target, self._background, source)
+        painter.end()
+    
+    def _build_tab(self, index):
+        setup = self._tab_setups.pop(self.tabs.widget(index), None)
+        if setup is not None:
+            setup()
+
     def setup_style(self):
-        dark_palette = QPalette()
-        dark_palette.setColor(QPalette.Window, QColor(8, 8, 25))
-        dark_palette.setColor(QPalette.WindowText, QColor(230, 230, 255))
-        dark_palette.setColor(QPalette.Base, QColor(12, 12, 30))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(18, 18, 40))
-        dark_palette.setColor(QPalette.ToolTipBase, QColor(230, 230, 255))
-        dark_palette.setColor(QPalette.ToolTipText, QColor(230, 230, 255))
-        dark_palette.setColor(QPalette.Text, QColor(230, 230, 255))
-        dark_palette.setColor(QPalette.Button, QColor(25, 25, 55))
-        dark_palette.setColor(QPalette.ButtonText, QColor(240, 240, 255))
-        dark_palette.setColor(QPalette.BrightText, QColor(12, 235, 240))
-        dark_palette.setColor(QPalette.Link, QColor(12, 235, 240))
-        dark_palette.setColor(QPalette.Highlight, QColor(122, 4, 235))
-        dark_palette.setColor(QPalette.HighlightedText, QColor(240, 240, 255))
-        
-        self.setPalette(dark_palette)
-        
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #08081a, stop:0.5 #0c0c25, stop:1 #15153a);
-                color: #e6e6ff;
-                font-size: 10pt;
-            }
-            QTabWidget::pane {
-                border: 2px solid #0cebf0;
-                background-color: rgba(8, 8, 25, 0.9);
-                border-radius: 10px;
-                margin-top: -1px;
-            }
-            QTabBar::tab {
-                background-color: rgba(25, 25, 55, 0.8);
-                color: #e6e6ff;
-                padding: 12px 30px;
-                border: 1px solid #0cebf0;
-                border-bottom: none;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                font-family: Arial, sans-serif;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-                margin-right: 3px;
-                min-width: 120px;
-                text-align: center;
-            }
-            QTabBar::tab:selected {
-                background-color: rgba(12, 12, 30, 0.9);
-                border-bottom: 3px solid #0cebf0;
-                color: #0cebf0;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: rgba(35, 35, 70, 0.8);
-                color: #0cebf0;
-            }
-            QPushButton {
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #7a04eb, stop:1 #0cebf0);
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 10px;
-                font-family: Arial, sans-serif;
-                font-weight: bold;
-                letter-spacing: 1.5px;
-                text-transform: uppercase;
-            }
-            QPushButton:hover {
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #8a14fb, stop:1 #1cfbff);
-                border: 2px solid #ffffff;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #6a04cb, stop:1 #0ca9b0);
-                color: #e0e0ff;
-            }
-            QPushButton:disabled {
-                background-color: #1a1a35;
-                color: #8a8aaa;
-            }
-            QLineEdit, QTextEdit, QListWidget, QTableWidget {
-                background-color: rgba(12, 12, 30, 1.0);
-                color: #e6e6ff;
-                border: 2px solid #0cebf0;
-                border-radius: 10px;
-                padding: 10px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 2px solid #7a04eb;
-                background-color: rgba(15, 15, 35, 0.9);
-            }
-            QProgressBar {
-                border: 2px solid #0cebf0;
-                border-radius: 10px;
-                text-align: center;
-                background-color: rgba(12, 12, 30, 1.0);
-                height: 24px;
-                color: white;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7a04eb, stop:1 #0cebf0);
-                border-radius: 8px;
-            }
-            QGroupBox {
-                border: 2px solid #0cebf0;
-                border-radius: 10px;
-                margin-top: 2.5ex;
-                padding-top: 2.5ex;
-                background-color: rgba(15, 15, 35, 0.7);
-                font-size: 11pt;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 15px;
-                color: #0cebf0;
-                font-weight: bold;
-                font-size: 11pt;
-                letter-spacing: 1px;
-            }
-            QLabel {
-                color: #e6e6ff;
-                font-size: 10pt;
-            }
-            QCheckBox {
-                color: #e6e6ff;
-                spacing: 10px;
-                font-size: 10pt;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #0cebf0;
-                border-radius: 5px;
-                background-color: rgba(12, 12, 30, 1.0);
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0cebf0;
-            }
-            QRadioButton {
-                color: #e6e6ff;
-                spacing: 10px;
-                font-size: 10pt;
-            }
-            QRadioButton::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #0cebf0;
-                border-radius: 10px;
-                background-color: rgba(12, 12, 30, 1.0);
-            }
-            QRadioButton::indicator:checked {
-                background-color: rgba(12, 12, 30, 1.0);
-            }
-            QTableWidget {
-                gridline-color: #0cebf0;
-                selection-background-color: rgba(122, 4, 235, 0.4);
-                alternate-background-color: rgba(20, 20, 40, 0.5);
-            }
-            QHeaderView::section {
-                background-color: rgba(25, 25, 55, 0.8);
-                color: #e6e6ff;
-                padding: 8px;
-                border: 1px solid #0cebf0;
-                font-weight: bold;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: rgba(12, 12, 30, 0.3);
-                width: 14px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7a04eb, stop:1 #0cebf0);
-                min-height: 30px;
-                border-radius: 7px;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: rgba(12, 12, 30, 0.3);
-                height: 14px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #7a04eb, stop:1 #0cebf0);
-                min-width: 30px;
-                border-radius: 7px;
-            }
-            #hide_image_preview, #extract_image_preview {
-                background-color: rgba(8, 8, 20, 0.8);
-                border: 2px solid #0cebf0;
-                border-radius: 10px;
-                padding: 5px;
-            }
-        """)
+        # The style sheet itself is applied application-wide in main()
+        self.setPalette(dark_palette())
     
     def setup_hide_tab(self):
         layout = QVBoxLayout(self.hide_tab)
@@ -1096,7 +1212,7 @@ class MainWindow(QMainWindow):
         self.hide_image_path.setPlaceholderText("Select an image file...")
         image_select_layout.addWidget(self.hide_image_path)
         
-        browse_image_btn = QPushButton("Browse")
+        browse_image_btn = QPushButton("BROWSE")
         browse_image_btn.clicked.connect(self.browse_hide_image)
         image_select_layout.addWidget(browse_image_btn)
         
@@ -1116,18 +1232,19 @@ class MainWindow(QMainWindow):
         
         files_select_layout = QHBoxLayout()
         self.hide_files_list = QListWidget()
+        self._hide_paths = {}  # Paths in hide_files_list, in list order (values unused)
         files_select_layout.addWidget(self.hide_files_list)
         
         files_buttons_layout = QVBoxLayout()
-        add_files_btn = QPushButton("Add Files")
+        add_files_btn = QPushButton("ADD FILES")
         add_files_btn.clicked.connect(self.add_files_to_hide)
         files_buttons_layout.addWidget(add_files_btn)
         
-        remove_files_btn = QPushButton("Remove Selected")
+        remove_files_btn = QPushButton("REMOVE SELECTED")
         remove_files_btn.clicked.connect(self.remove_selected_files)
         files_buttons_layout.addWidget(remove_files_btn)
         
-        clear_files_btn = QPushButton("Clear All")
+        clear_files_btn = QPushButton("CLEAR ALL")
         clear_files_btn.clicked.connect(self.clear_files_list)
         files_buttons_layout.addWidget(clear_files_btn)
         
@@ -1157,7 +1274,7 @@ class MainWindow(QMainWindow):
         self.hide_output_path.setPlaceholderText("Will be set automatically")
         output_layout.addWidget(self.hide_output_path)
         
-        browse_output_btn = QPushButton("Browse")
+        browse_output_btn = QPushButton("BROWSE")
         browse_output_btn.clicked.connect(self.browse_hide_output)
         output_layout.addWidget(browse_output_btn)
         
@@ -1179,7 +1296,7 @@ class MainWindow(QMainWindow):
         
         buttons_layout = QHBoxLayout()
         
-        hide_files_btn = QPushButton("Hide Files")
+        hide_files_btn = QPushButton("HIDE FILES")
         hide_files_btn.clicked.connect(self.start_hiding_files)
         buttons_layout.addWidget(hide_files_btn)
         
@@ -1197,7 +1314,7 @@ class MainWindow(QMainWindow):
         self.extract_image_path.setPlaceholderText("Select an image file...")
         image_select_layout.addWidget(self.extract_image_path)
         
-        browse_image_btn = QPushButton("Browse")
+        browse_image_btn = QPushButton("BROWSE")
         browse_image_btn.clicked.connect(self.browse_extract_image)
         image_select_layout.addWidget(browse_image_btn)
         
@@ -1230,7 +1347,7 @@ class MainWindow(QMainWindow):
         self.extract_output_dir.setPlaceholderText("Select output directory...")
         output_layout.addWidget(self.extract_output_dir)
         
-        browse_output_btn = QPushButton("Browse")
+        browse_output_btn = QPushButton("BROWSE")
         browse_output_btn.clicked.connect(self.browse_extract_output)
         output_layout.addWidget(browse_output_btn)
         
@@ -1252,7 +1369,7 @@ class MainWindow(QMainWindow):
         
         buttons_layout = QHBoxLayout()
         
-        extract_files_btn = QPushButton("Extract Files")
+        extract_files_btn = QPushButton("EXTRACT FILES")
         extract_files_btn.clicked.connect(self.start_extracting_files)
         buttons_layout.addWidget(extract_files_btn)
         
@@ -1261,17 +1378,20 @@ class MainWindow(QMainWindow):
     def setup_history_tab(self):
         layout = QVBoxLayout(self.history_tab)
         
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels(["Date", "Operation", "Image", "Files", "Status"])
+        self.history_model = HistoryModel(self.load_history(), self)
+        
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Every row keeps the default height, so rows are never measured
+        self.history_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.history_table.setSelectionBehavior(QTableView.SelectRows)
+        self.history_table.setEditTriggers(QTableView.NoEditTriggers)
         layout.addWidget(self.history_table)
         
         buttons_layout = QHBoxLayout()
         
-        clear_history_btn = QPushButton("Clear History")
+        clear_history_btn = QPushButton("CLEAR HISTORY")
         clear_history_btn.clicked.connect(self.clear_history)
         buttons_layout.addWidget(clear_history_btn)
         
@@ -1408,14 +1528,16 @@ class MainWindow(QMainWindow):
             self.update_image_preview(file_path, self.hide_image_preview)
             
             if not self.hide_output_path.text():
-                dir_path, file_name = os.path.split(file_path)
-                name, ext = os.path.splitext(file_name)
-                output_path = os.path.join(dir_path, f"{name}_hidden{ext}")
+                file_info = QFileInfo(file_path)
+                ext = f".{file_info.suffix()}" if file_info.suffix() else ""
+                if ext.lower() in LOSSY_EXTENSIONS:
+                    ext = ".png"
+                output_path = f"{file_info.absolutePath()}/{file_info.completeBaseName()}_hidden{ext}"
                 self.hide_output_path.setText(output_path)
     
     def browse_hide_output(self):
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Output Image", "", "Image Files (*.png *.jpg *.jpeg *.bmp)"
+            self, "Save Output Image", "", "Image Files (*.png *.bmp)"
         )
         if file_path:
             self.hide_output_path.setText(file_path)
@@ -1424,15 +1546,30 @@ class MainWindow(QMainWindow):
         file_paths, _ = QFileDialog.getOpenFileNames(
             self, "Select Files to Hide", "", "All Files (*.*)"
         )
-        for file_path in file_paths:
-            if not self.hide_files_list.findItems(file_path, Qt.MatchExactly):
-                self.hide_files_list.addItem(file_path)
+        new_paths = [path for path in dict.fromkeys(file_paths) if path not in self._hide_paths]
+        if not new_paths:
+            return
+        self._hide_paths.update(dict.fromkeys(new_paths))
+        # Repaint once after the whole batch is in
+        self.hide_files_list.setUpdatesEnabled(False)
+        try:
+            self.hide_files_list.addItems(new_paths)
+        finally:
+            self.hide_files_list.setUpdatesEnabled(True)
     
     def remove_selected_files(self):
-        for item in self.hide_files_list.selectedItems():
-            self.hide_files_list.takeItem(self.hide_files_list.row(item))
+        # Take rows from the bottom up so the remaining row numbers stay valid
+        rows = sorted({index.row() for index in self.hide_files_list.selectedIndexes()}, reverse=True)
+        self.hide_files_list.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                item = self.hide_files_list.takeItem(row)
+                self._hide_paths.pop(item.text(), None)
+        finally:
+            self.hide_files_list.setUpdatesEnabled(True)
     
     def clear_files_list(self):
+        self._hide_paths.clear()
         self.hide_files_list.clear()
     
     def browse_extract_image(self):
@@ -1452,21 +1589,42 @@ class MainWindow(QMainWindow):
     
     def update_image_preview(self, image_path, preview_label):
         try:
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
+            key = (image_path, os.path.getmtime(image_path), preview_label.width(), preview_label.height())
+            pixmap = self._preview_cache.get(key)
+            if pixmap is not None:
+                self._preview_cache.move_to_end(key)
+                preview_label.setPixmap(pixmap)
+                return
+            
+            # Let the decoder scale the image down instead of decoding it at full size
+            reader = QtGui.QImageReader(image_path)
+            size = reader.size()
+            if size.isValid():
+                size.scale(preview_label.width(), preview_label.height(), Qt.KeepAspectRatio)
+                reader.setScaledSize(size)
+            image = reader.read()
+            if image.isNull():
+                preview_label.setText("Failed to load image")
+                return
+            
+            pixmap = QPixmap.fromImage(image)
+            if not size.isValid():
+                # The format can't report its size up front, so scale after decoding
                 pixmap = pixmap.scaled(
                     preview_label.width(), preview_label.height(),
-                    Qt.KeepAspectRatio, Qt.SmoothTransformation
+                    Qt.KeepAspectRatio, Qt.FastTransformation
                 )
-                preview_label.setPixmap(pixmap)
-            else:
-                preview_label.setText("Failed to load image")
+            self._preview_cache[key] = pixmap
+            if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+            preview_label.setPixmap(pixmap)
         except Exception as e:
             preview_label.setText(f"Error: {str(e)}")
     
     def start_hiding_files(self):
+        # Paths are checked for existence by the worker, off the GUI thread
         image_path = self.hide_image_path.text()
-        if not image_path or not os.path.isfile(image_path):
+        if not image_path:
             QMessageBox.warning(self, "Error", "Please select a valid carrier image.")
             return
         
@@ -1475,16 +1633,15 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please specify an output image path.")
             return
         
-        files = [self.hide_files_list.item(i).text() for i in range(self.hide_files_list.count())]
+        if os.path.splitext(output_path)[1].lower() in LOSSY_EXTENSIONS:
+            QMessageBox.warning(self, "Error", "The output image must be a PNG or BMP file.")
+            return
+        
+        files = list(self._hide_paths)
         if not files:
             QMessageBox.warning(self, "Error", "Please add at least one file to hide.")
             return
         
-        for file_path in files:
-            if not os.path.isfile(file_path):
-                QMessageBox.warning(self, "Error", f"File not found: {file_path}")
-                return
-        
         password = self.hide_password.text() if self.hide_password.text() else None
         
         params = {
@@ -1494,25 +1651,19 @@ class MainWindow(QMainWindow):
             "password": password
         }
         
-        self.worker = WorkerThread("hide", params)
-        self.worker.progress_signal.connect(self.update_hide_progress)
-        self.worker.status_signal.connect(self.update_hide_status)
-        self.worker.finished_signal.connect(self.hide_operation_finished)
-        
-        self.hide_tab.setEnabled(False)
-        self.hide_progress_bar.setValue(0)
-        self.hide_status_label.setText("Starting operation...")
-        
-        self.worker.start()
+        self._start_worker("hide", params, self.hide_tab, self.hide_progress_bar,
+                           self.hide_status_label, self.update_hide_progress,
+                           self.update_hide_status, self.hide_operation_finished)
     
     def start_extracting_files(self):
+        # Paths are checked for existence by the worker, off the GUI thread
         image_path = self.extract_image_path.text()
-        if not image_path or not os.path.isfile(image_path):
+        if not image_path:
             QMessageBox.warning(self, "Error", "Please select a valid image.")
             return
         
         output_dir = self.extract_output_dir.text()
-        if not output_dir or not os.path.isdir(output_dir):
+        if not output_dir:
             QMessageBox.warning(self, "Error", "Please specify a valid output directory.")
             return
         
@@ -1524,17 +1675,35 @@ class MainWindow(QMainWindow):
             "password": password
         }
         
-        self.worker = WorkerThread("extract", params)
-        self.worker.progress_signal.connect(self.update_extract_progress)
-        self.worker.status_signal.connect(self.update_extract_status)
-        self.worker.finished_signal.connect(self.extract_operation_finished)
-        
-        self.extract_tab.setEnabled(False)
-        self.extract_progress_bar.setValue(0)
-        self.extract_status_label.setText("Starting operation...")
+        self._start_worker("extract", params, self.extract_tab, self.extract_progress_bar,
+                           self.extract_status_label, self.update_extract_progress,
+                           self.update_extract_status, self.extract_operation_finished)
+    
+    def _start_worker(self, task_type, params, tab, progress_bar, status_label,
+                      on_progress, on_status, on_finished):
+        """Run a WorkerThread task while its tab is disabled"""
+        # Parented so a worker still running is not destroyed when self.worker
+        # is replaced; it deletes itself once its thread has finished
+        self.worker = WorkerThread(task_type, params, self)
+        self.worker.progress_signal.connect(on_progress)
+        self.worker.status_signal.connect(on_status)
+        self.worker.finished_signal.connect(on_finished)
+        self.worker.invalid_path_signal.connect(
+            lambda message: self._worker_path_invalid(tab, status_label, message))
+        self.worker.finished.connect(self.worker.deleteLater)
+        
+        tab.setEnabled(False)
+        progress_bar.setValue(0)
+        status_label.setText("Starting operation...")
         
         self.worker.start()
     
+    def _worker_path_invalid(self, tab, status_label, message):
+        # Input mistakes are warned about like before, not recorded in the history
+        tab.setEnabled(True)
+        status_label.setText("Ready")
+        QMessageBox.warning(self, "Error", message)
+    
     def update_hide_progress(self, value):
         self.hide_progress_bar.setValue(value)
     
@@ -1544,21 +1713,18 @@ class MainWindow(QMainWindow):
     
     def hide_operation_finished(self, success, result):
         self.hide_tab.setEnabled(True)
+        files = list(self._hide_paths)
         
         if success:
             QMessageBox.information(
                 self, "Success", f"Files successfully hidden in image:\n{result}"
             )
             
-            self.add_to_history("Hide", self.hide_image_path.text(), 
-                               [self.hide_files_list.item(i).text() for i in range(self.hide_files_list.count())],
-                               "Success")
+            self.add_to_history("Hide", self.hide_image_path.text(), files, "Success")
         else:
             QMessageBox.critical(self, "Error", f"Operation failed: {result}")
             
-            self.add_to_history("Hide", self.hide_image_path.text(), 
-                               [self.hide_files_list.item(i).text() for i in range(self.hide_files_list.count())],
-                               f"Failed: {result}")
+            self.add_to_history("Hide", self.hide_image_path.text(), files, f"Failed: {result}")
     
     def update_extract_progress(self, value):
         self.extract_progress_bar.setValue(value)
@@ -1575,9 +1741,12 @@ class MainWindow(QMainWindow):
                 self, "Success", f"Files successfully extracted:\n{result}"
             )
             
-            self.add_to_history("Extract", self.extract_image_path.text(), 
-                               result.split('\n'),
-                               "Success")
+            # Only the first paths are kept; the rest are summarized by count
+            files = result.split('\n', HISTORY_MAX_FILES)
+            if len(files) > HISTORY_MAX_FILES:
+                remaining = files[-1].count('\n') + 1
+                files[-1] = f"... +{remaining} more"
+            self.add_to_history("Extract", self.extract_image_path.text(), files, "Success")
         else:
             QMessageBox.critical(self, "Error", f"Operation failed: {result}")
             
@@ -1587,58 +1756,89 @@ class MainWindow(QMainWindow):
     
     def add_to_history(self, operation, image, files, status):
         timestamp = datetime.datetime.now().isoformat()
-        entry = {
-            "timestamp": timestamp,
-            "operation": operation,
-            "image": image,
-            "files": files,
-            "status": status
-        }
         
-        self.history.append(entry)
-        self.save_history()
-        self.update_history_table()
+        # The history is loaded together with its tab
+        self._build_tab(self.tabs.indexOf(self.history_tab))
+        values = (timestamp, operation, image, files, status)
+        self.history_model.append(values)
+        self._pending_history.append(values)
+        self._history_save_timer.start()
+    
+    def flush_history(self):
+        """Append the pending history entries to the history file"""
+        self._history_save_timer.stop()
+        if not self._pending_history:
+            return
+        
+        # Only new entries are written; a history still in the legacy file is migrated whole
+        if not os.path.exists(self._history_path):
+            self.save_history()
+            return
+        try:
+            with open(self._history_path, 'a+b') as f:
+                # Start on a fresh line if an interrupted write left the last one unterminated
+                data = b"".join(_json_dumps(dict(zip(HISTORY_FIELDS, values))) + b"\n"
+                                for values in self._pending_history)
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+                f.write(data)
+            self._pending_history.clear()
+        except Exception as e:
+            print(f"Error saving history: {str(e)}")
     
     def load_history(self):
-        history_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
-        if os.path.exists(history_path):
-            try:
-                with open(history_path, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
+        """Load the history as one list per field in HISTORY_FIELDS"""
+        try:
+            if os.path.exists(self._history_path):
+                # Only the newest lines are kept; the file is trimmed to them once it outgrows the cap
+                lines = deque(maxlen=HISTORY_MAX_ENTRIES)
+                line_count = 0
+                with open(self._history_path, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            lines.append(line)
+                            line_count += 1
+                entries = []
+                for line in lines:
+                    # A line torn by an interrupted write is skipped, not the whole history
+                    try:
+                        entries.append(_json_loads(line))
+                    except ValueError:
+                        pass
+                if line_count > HISTORY_MAX_ENTRIES:
+                    self._write_history_lines(lines)
+            elif os.path.exists(self._legacy_history_path):
+                with open(self._legacy_history_path, 'rb') as f:
+                    entries = _json_loads(f.read())[-HISTORY_MAX_ENTRIES:]
+            else:
+                entries = []
+            entries = [entry for entry in entries
+                       if isinstance(entry, dict) and all(field in entry for field in HISTORY_FIELDS)]
+            return tuple([entry[field] for entry in entries] for field in HISTORY_FIELDS)
+        except Exception:
+            return tuple([] for _ in HISTORY_FIELDS)
     
     def save_history(self):
-        history_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+        """Rewrite the whole history file from the model"""
+        self._history_save_timer.stop()
+        if self._write_history_lines(_json_dumps(dict(zip(HISTORY_FIELDS, row)))
+                                     for row in zip(*self.history_model.columns)):
+            self._pending_history.clear()
+    
+    def _write_history_lines(self, lines):
+        """Atomically replace the history file with the given encoded entries; return whether it worked"""
+        tmp_path = self._history_path + ".tmp"
         try:
-            with open(history_path, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.write(b"".join(line + b"\n" for line in lines))
+            os.replace(tmp_path, self._history_path)
+            return True
         except Exception as e:
             print(f"Error saving history: {str(e)}")
-    
-    def update_history_table(self):
-        self.history_table.setRowCount(0)
-        
-        for entry in self.history:
-            row = self.history_table.rowCount()
-            self.history_table.insertRow(row)
-            
-            try:
-                dt = datetime.datetime.fromisoformat(entry["timestamp"])
-                formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except Exception:
-                formatted_time = entry["timestamp"]
-            
-            files_str = ", ".join([os.path.basename(f) for f in entry["files"]])
-            if len(files_str) > 50:
-                files_str = files_str[:47] + "..."
-            
-            self.history_table.setItem(row, 0, QTableWidgetItem(formatted_time))
-            self.history_table.setItem(row, 1, QTableWidgetItem(entry["operation"]))
-            self.history_table.setItem(row, 2, QTableWidgetItem(os.path.basename(entry["image"])))
-            self.history_table.setItem(row, 3, QTableWidgetItem(files_str))
-            self.history_table.setItem(row, 4, QTableWidgetItem(entry["status"]))
+            return False
     
     def clear_history(self):
         reply = QMessageBox.question(
@@ -1647,17 +1847,65 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.history = []
-            self.save_history()
-            self.update_history_table()
+            self._history_save_timer.stop()
+            self._pending_history.clear()
+            self.history_model.clear()
+            # Truncate rather than delete, so a legacy history file is not picked up again
+            try:
+                open(self._history_path, 'wb').close()
+            except Exception as e:
+                print(f"Error saving history: {str(e)}")
+
+
+@functools.lru_cache(maxsize=None)
+def dark_palette() -> QPalette:
+    """Build the main window palette once"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(8, 8, 25))
+    palette.setColor(QPalette.WindowText, QColor(230, 230, 255))
+    palette.setColor(QPalette.Base, QColor(12, 12, 30))
+    palette.setColor(QPalette.AlternateBase, QColor(18, 18, 40))
+    palette.setColor(QPalette.ToolTipBase, QColor(230, 230, 255))
+    palette.setColor(QPalette.ToolTipText, QColor(230, 230, 255))
+    palette.setColor(QPalette.Text, QColor(230, 230, 255))
+    palette.setColor(QPalette.Button, QColor(25, 25, 55))
+    palette.setColor(QPalette.ButtonText, QColor(240, 240, 255))
+    palette.setColor(QPalette.BrightText, QColor(12, 235, 240))
+    palette.setColor(QPalette.Link, QColor(12, 235, 240))
+    palette.setColor(QPalette.Highlight, QColor(122, 4, 235))
+    palette.setColor(QPalette.HighlightedText, QColor(240, 240, 255))
+    return palette
+
+
+def resource_path(name: str) -> str:
+    """Return the path of a bundled resource, preferring the compiled Qt resources"""
+    if resources_rc is not None:
+        return f":/{name}"
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+
+@functools.lru_cache(maxsize=None)
+def load_stylesheet(name: str = STYLE_FILE) -> str:
+    """Read a bundled style sheet, once per name"""
+    qss_file = QtCore.QFile(resource_path(name))
+    if not qss_file.open(QtCore.QIODevice.ReadOnly | QtCore.QIODevice.Text):
+        return ""
+    try:
+        return bytes(qss_file.readAll()).decode('utf-8')
+    finally:
+        qss_file.close()
 
 
 def main():
     app = QApplication(sys.argv)
+    # Parse the style sheet once for the whole application
+    app.setStyleSheet(load_stylesheet())
     window = AppController()
     window.show()
     sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
+    # Required for the worker processes in frozen builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file